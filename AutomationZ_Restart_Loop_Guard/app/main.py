@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import bisect
+import copy
+import hashlib
 import json
+import os
+import queue
+import threading
 import time
 import socket
 import urllib.request
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +22,16 @@ try:
 except Exception as e:
     raise SystemExit(f"Tkinter is required. Error: {e}")
 
+try:
+    import urllib3  # optional: keep-alive for Discord webhook POSTs
+except Exception:
+    urllib3 = None
+
+try:
+    import orjson  # optional: C-accelerated JSON for hot-path state files
+except Exception:
+    orjson = None
+
 # -----------------------------
 # AutomationZ Dark Theme (fixed)
 # -----------------------------
@@ -27,6 +43,13 @@ C_ACCENT = "#4CAF50"
 C_WARN = "#ffb74d"
 C_BAD = "#ef5350"
 
+# state -> (badge bg, badge fg, badge text)
+_BADGE = {
+    "OK": (C_ACCENT, "#ffffff", "OK"),
+    "WARNING": (C_WARN, "#111111", "WARNING"),
+    "LOCKED": (C_BAD, "#111111", "LOCKED"),
+}
+
 def apply_dark_theme(root: tk.Tk) -> ttk.Style:
     style = ttk.Style(root)
     try:
@@ -84,53 +107,184 @@ def style_listbox(lb: tk.Listbox) -> None:
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_FILE = BASE_DIR / "restart_loop_config.json"
+
+DEFAULT_CFG: Dict[str, Any] = {
+    "max_attempts": 3,
+    "time_window_seconds": 300,
+    "backoff_seconds": [0, 60, 180, 300],
+    "state_file": "attempt_history.json",
+    "lock_file": "restart_loop.lock",
+    "incident_file": "incident_report.json",
+    "log_file": "restart_loop.log",
+    "notify": {
+        "enabled": False,
+        "discord_webhook_url": "",
+        "include_last_lines": 40,
+        "extra_context": {
+            "server_name": "THE LONG HUNT",
+            "host": "",
+            "notes": ""
+        }
+    }
+}
 HELP_TEXT = "Restart Loop Guard works locally.\n\nIt guards restart/start attempts (not crashes).\nIf restart attempts originate from another machine, run the tool there.\n\nTypical use:\n- Your restart script calls the guard before attempting a restart.\n- If the guard locks, your script should stop restarting until an admin unlocks.\n"
 
 def _now_ts() -> int:
     return int(time.time())
 
 def _iso(ts: Optional[int] = None) -> str:
-    if ts is None:
-        return datetime.now().isoformat(timespec="seconds")
-    return datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+    # Same output as datetime.isoformat(timespec="seconds") but without
+    # allocating a datetime per rendered history row.
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+# Parsed-JSON cache keyed on (mtime_ns, size) so repeated loads of an
+# untouched file cost a single stat() instead of a read + parse.
+_JSON_CACHE: Dict[Path, tuple[int, int, Any]] = {}
 
 def load_json(path: Path, default: Any) -> Any:
     try:
-        if path.exists():
-            return json.loads(path.read_text(encoding="utf-8"))
+        st = path.stat()
+    except OSError:
+        return default
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
-        pass
-    return default
-
-def save_json(path: Path, data: Any) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        return default
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+# Digest of the last content written per path; identical rewrites are skipped.
+_WRITE_HASHES: Dict[Path, bytes] = {}
+
+def save_json(path: Path, data: Any, pretty: bool = False) -> None:
+    if pretty:
+        data_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    elif orjson is not None:
+        data_bytes = orjson.dumps(data)
+    else:
+        data_bytes = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    digest = hashlib.blake2b(data_bytes, digest_size=8).digest()
+    if _WRITE_HASHES.get(path) == digest:
+        return
+    _JSON_CACHE.pop(path, None)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data_bytes)
+    os.replace(tmp, path)
+    _WRITE_HASHES[path] = digest
+
+# Log lines are buffered and flushed in batches (timer / size threshold /
+# shutdown) so each append is not its own open/write/close cycle.
+_log_lock = threading.Lock()
+_log_buffer: Dict[Path, List[str]] = {}
+_log_buffered = 0
+_LOG_FLUSH_BYTES = 64 * 1024
 
 def append_log(log_file: Path, msg: str) -> None:
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(f"[{_iso()}] {msg}\n")
+    global _log_buffered
+    line = f"[{_iso()}] {msg}\n"
+    with _log_lock:
+        _log_buffer.setdefault(log_file, []).append(line)
+        _log_buffered += len(line)
+        if _log_buffered < _LOG_FLUSH_BYTES:
+            return
+    flush_log_buffer()
+
+def flush_log_buffer() -> None:
+    global _log_buffered
+    with _log_lock:
+        if not _log_buffer:
+            return
+        pending = {path: "".join(lines) for path, lines in _log_buffer.items()}
+        _log_buffer.clear()
+        _log_buffered = 0
+    for path, text in pending.items():
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
 
 def tail_file(path: Path, n: int) -> str:
-    if n <= 0 or not path.exists():
+    if n <= 0:
         return ""
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            # Read fixed-size blocks backwards until enough newlines are
+            # seen, so the cost is bounded by n lines, not the file size.
+            block = max(4096, 128 * n)
+            chunks: List[bytes] = []
+            newlines = 0
+            while pos > 0 and newlines <= n:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        data = b"".join(reversed(chunks))
+        lines = data.decode("utf-8", errors="ignore").splitlines()
         return "\n".join(lines[-n:])
     except Exception:
         return ""
 
-def post_discord(webhook_url: str, content: str) -> None:
+_https_pool = None
+
+def _get_https_pool():
+    global _https_pool
+    if _https_pool is None and urllib3 is not None:
+        _https_pool = urllib3.PoolManager(maxsize=2)
+    return _https_pool
+
+def _post_discord_sync(webhook_url: str, content: str) -> None:
     if not webhook_url:
         return
     payload = json.dumps({"content": content}).encode("utf-8")
-    req = urllib.request.Request(
-        webhook_url,
-        data=payload,
-        headers={"Content-Type": "application/json", "User-Agent": "AutomationZ-RestartLoopGuard-UI/1.1"},
-        method="POST",
-    )
+    headers = {"Content-Type": "application/json", "User-Agent": "AutomationZ-RestartLoopGuard-UI/1.1"}
+    pool = _get_https_pool()
+    if pool is not None:
+        # Reused connections skip the TCP+TLS handshake on repeat posts.
+        # urllib3 does not raise on HTTP errors the way urlopen does, so
+        # surface them here for the worker/test paths.
+        resp = pool.request("POST", webhook_url, body=payload, headers=headers, timeout=10.0)
+        if resp.status >= 400:
+            raise RuntimeError(f"Discord returned {resp.status}")
+        return
+    req = urllib.request.Request(webhook_url, data=payload, headers=headers, method="POST")
     with urllib.request.urlopen(req, timeout=10) as resp:
         resp.read()
 
+# Notifications are posted from a background worker so a slow/unreachable
+# webhook never blocks the Tk main loop.
+_discord_queue: "queue.Queue[tuple[str, str, Optional[Path]]]" = queue.Queue()
+_discord_thread: Optional[threading.Thread] = None
+
+def _discord_worker() -> None:
+    while True:
+        webhook_url, content, log_file = _discord_queue.get()
+        try:
+            _post_discord_sync(webhook_url, content)
+            if log_file is not None:
+                append_log(log_file, "Notification sent (Discord).")
+        except Exception as e:
+            if log_file is not None:
+                append_log(log_file, f"Notification failed: {e!r}")
+
+def _start_discord_worker() -> None:
+    global _discord_thread
+    if _discord_thread is None:
+        _discord_thread = threading.Thread(target=_discord_worker, daemon=True)
+        _discord_thread.start()
+
+def post_discord(webhook_url: str, content: str, log_file: Optional[Path] = None) -> None:
+    if not webhook_url:
+        return
+    _discord_queue.put((webhook_url, content, log_file))
+
 @dataclass
 class Status:
     state: str
@@ -144,7 +298,9 @@ def compute_status(cfg: Dict[str, Any], history: List[int], now: int, locked: bo
     max_attempts = int(cfg.get("max_attempts", 3))
     window = int(cfg.get("time_window_seconds", 300))
 
-    windowed = [int(t) for t in history if now - int(t) <= window]
+    # History is kept sorted (appended monotonically), so the window
+    # cutoff is a binary search instead of a full scan.
+    windowed = history[bisect.bisect_left(history, now - window):]
     count = len(windowed)
 
     if locked:
@@ -155,8 +311,17 @@ def compute_status(cfg: Dict[str, Any], history: List[int], now: int, locked: bo
 
     return Status("OK", f"Normal: {count}/{max_attempts} within {window}s.", count, max_attempts, window, windowed)
 
-def make_incident(cfg: Dict[str, Any], status: Status, now: int) -> Dict[str, Any]:
-    extra = (cfg.get("notify", {}) or {}).get("extra_context", {}) if isinstance(cfg.get("notify", {}), dict) else {}
+def _normalize_cfg(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce the notify section to dicts once so downstream code can
+    index it directly instead of repeating isinstance checks."""
+    if not isinstance(cfg.get("notify"), dict):
+        cfg["notify"] = {}
+    if not isinstance(cfg["notify"].get("extra_context"), dict):
+        cfg["notify"]["extra_context"] = {}
+    return cfg
+
+def make_incident(cfg: Dict[str, Any], status: Status, now: int, hostname: str, fqdn: str) -> Dict[str, Any]:
+    extra = cfg["notify"]["extra_context"]
     return {
         "version": "1.1-ui",
         "time": _iso(now),
@@ -167,7 +332,7 @@ def make_incident(cfg: Dict[str, Any], status: Status, now: int) -> Dict[str, An
         "max_attempts": status.max_attempts,
         "window_seconds": status.window_seconds,
         "attempt_timestamps": status.timestamps,
-        "host": {"hostname": socket.gethostname(), "fqdn": socket.getfqdn()},
+        "host": {"hostname": hostname, "fqdn": fqdn},
         "automationz": extra,
     }
 
@@ -180,15 +345,31 @@ class App(tk.Tk):
         self.minsize(900, 590)
 
         self.cfg: Dict[str, Any] = {}
+        self.history: deque[int] = deque(maxlen=10_000)
+        self._lb_shown: List[int] = []
+        self._log_shown_end: Optional[int] = None
+        self._refresh_pending = False
+        self._last_render: Optional[tuple] = None
+        self._last_notify: Optional[tuple] = None
+        self._last_notify_ts = 0.0
         self.state_file: Path
         self.lock_file: Path
         self.incident_file: Path
         self.log_file: Path
 
+        # Resolved once: getfqdn can block for seconds on broken DNS.
+        self._hostname = socket.gethostname()
+        self._fqdn = socket.getfqdn()
+
+        _start_discord_worker()
+
         self._build_ui()
         self._load_cfg(silent=True)
         self.refresh_status(record=False)
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(250, self._flush_logs)
+
     def _build_ui(self) -> None:
         outer = ttk.Frame(self, padding=14)
         outer.pack(fill="both", expand=True)
@@ -211,18 +392,16 @@ class App(tk.Tk):
 
         nb = ttk.Notebook(outer)
         nb.pack(fill="both", expand=True)
+        self._nb = nb
         self.tab_main = ttk.Frame(nb)
         self.tab_help = ttk.Frame(nb)
         nb.add(self.tab_main, text="Dashboard")
         nb.add(self.tab_help, text="Help")
 
-        help_box = ttk.LabelFrame(self.tab_help, text="How it works", padding=10)
-        help_box.pack(fill="both", expand=True, padx=10, pady=10)
-        txt = tk.Text(help_box, bg=C_PANEL, fg=C_TEXT, insertbackground=C_TEXT,
-                      relief="flat", bd=0, highlightbackground="#1f1f1f", highlightcolor=C_ACCENT, wrap="word")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", HELP_TEXT)
-        txt.configure(state="disabled")
+        # The Help tab stays empty until first viewed so the Dashboard
+        # paints without the extra Text widget.
+        self._help_built = False
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         top = ttk.Frame(self.tab_main, padding=10)
         top.pack(fill="both", expand=True)
@@ -241,26 +420,24 @@ class App(tk.Tk):
         self.var_notify_enabled = tk.BooleanVar()
         self.var_webhook = tk.StringVar()
 
-        row = ttk.Frame(cfg_box); row.pack(fill="x", pady=4)
-        ttk.Label(row, text="Max attempts").pack(side="left")
-        ttk.Entry(row, textvariable=self.var_max, width=10).pack(side="right")
-
-        row = ttk.Frame(cfg_box); row.pack(fill="x", pady=4)
-        ttk.Label(row, text="Window (sec)").pack(side="left")
-        ttk.Entry(row, textvariable=self.var_window, width=10).pack(side="right")
-
-        row = ttk.Frame(cfg_box); row.pack(fill="x", pady=4)
-        ttk.Label(row, text="Backoff list").pack(side="left")
-        ttk.Entry(row, textvariable=self.var_backoff, width=28).pack(side="right")
-
-        ttk.Separator(cfg_box).pack(fill="x", pady=(10, 8))
-
-        row = ttk.Frame(cfg_box); row.pack(fill="x", pady=4)
-        ttk.Checkbutton(row, text="Discord notify", variable=self.var_notify_enabled).pack(side="left")
-
-        row = ttk.Frame(cfg_box); row.pack(fill="x", pady=4)
-        ttk.Label(row, text="Webhook URL").pack(anchor="w")
-        ttk.Entry(row, textvariable=self.var_webhook, width=34).pack(fill="x", pady=(2, 0))
+        # One grid container instead of a ttk.Frame per row: fewer Tk
+        # widgets to create and style-resolve on first paint.
+        fields = (
+            ("Max attempts", self.var_max, 10),
+            ("Window (sec)", self.var_window, 10),
+            ("Backoff list", self.var_backoff, 28),
+        )
+        for r, (label, var, width) in enumerate(fields):
+            ttk.Label(cfg_box, text=label).grid(row=r, column=0, sticky="w", pady=4)
+            ttk.Entry(cfg_box, textvariable=var, width=width).grid(row=r, column=1, sticky="e", pady=4)
+
+        ttk.Separator(cfg_box).grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 8))
+        ttk.Checkbutton(cfg_box, text="Discord notify", variable=self.var_notify_enabled).grid(
+            row=4, column=0, columnspan=2, sticky="w", pady=4)
+        ttk.Label(cfg_box, text="Webhook URL").grid(row=5, column=0, columnspan=2, sticky="w", pady=(4, 0))
+        ttk.Entry(cfg_box, textvariable=self.var_webhook, width=34).grid(
+            row=6, column=0, columnspan=2, sticky="ew", pady=(2, 0))
+        cfg_box.columnconfigure(1, weight=1)
 
         btns = ttk.Frame(left)
         btns.pack(fill="x", pady=(10, 0))
@@ -303,45 +480,41 @@ class App(tk.Tk):
                                relief="flat", bd=0, highlightbackground="#1f1f1f", highlightcolor=C_ACCENT)
         self.txt_log.pack(fill="both", expand=True)
 
+    def _on_tab_changed(self, event: Any = None) -> None:
+        if self._help_built or self._nb.select() != str(self.tab_help):
+            return
+        self._help_built = True
+        help_box = ttk.LabelFrame(self.tab_help, text="How it works", padding=10)
+        help_box.pack(fill="both", expand=True, padx=10, pady=10)
+        txt = tk.Text(help_box, bg=C_PANEL, fg=C_TEXT, insertbackground=C_TEXT,
+                      relief="flat", bd=0, highlightbackground="#1f1f1f", highlightcolor=C_ACCENT, wrap="word")
+        txt.pack(fill="both", expand=True)
+        txt.insert("1.0", HELP_TEXT)
+        txt.configure(state="disabled")
+
     def _load_cfg(self, silent: bool = False) -> None:
         self.cfg = load_json(CONFIG_FILE, default={})
         if not self.cfg:
-            self.cfg = {
-  "max_attempts": 3,
-  "time_window_seconds": 300,
-  "backoff_seconds": [
-    0,
-    60,
-    180,
-    300
-  ],
-  "state_file": "attempt_history.json",
-  "lock_file": "restart_loop.lock",
-  "incident_file": "incident_report.json",
-  "log_file": "restart_loop.log",
-  "notify": {
-    "enabled": false,
-    "discord_webhook_url": "",
-    "include_last_lines": 40,
-    "extra_context": {
-      "server_name": "THE LONG HUNT",
-      "host": "",
-      "notes": ""
-    }
-  }
-}
-            save_json(CONFIG_FILE, self.cfg)
+            self.cfg = copy.deepcopy(DEFAULT_CFG)
+            save_json(CONFIG_FILE, self.cfg, pretty=True)
+
+        _normalize_cfg(self.cfg)
 
         self.state_file = BASE_DIR / self.cfg.get("state_file", "attempt_history.json")
         self.lock_file = BASE_DIR / self.cfg.get("lock_file", "restart_loop.lock")
         self.incident_file = BASE_DIR / self.cfg.get("incident_file", "incident_report.json")
         self.log_file = BASE_DIR / self.cfg.get("log_file", "restart_loop.log")
 
+        raw_history = load_json(self.state_file, default=[])
+        if not isinstance(raw_history, list):
+            raw_history = []
+        self.history = deque(sorted(int(t) for t in raw_history), maxlen=10_000)
+
         self.var_max.set(str(self.cfg.get("max_attempts", 3)))
         self.var_window.set(str(self.cfg.get("time_window_seconds", 300)))
         self.var_backoff.set(",".join(str(x) for x in (self.cfg.get("backoff_seconds", [0, 60, 180, 300]) or [])))
 
-        notify = self.cfg.get("notify", {}) if isinstance(self.cfg.get("notify", {}), dict) else {}
+        notify = self.cfg["notify"]
         self.var_notify_enabled.set(bool(notify.get("enabled", False)))
         self.var_webhook.set(str(notify.get("discord_webhook_url", "")))
 
@@ -360,62 +533,131 @@ class App(tk.Tk):
             self.cfg["time_window_seconds"] = win_s
             self.cfg["backoff_seconds"] = backoff
 
-            if "notify" not in self.cfg or not isinstance(self.cfg["notify"], dict):
-                self.cfg["notify"] = {}
             self.cfg["notify"]["enabled"] = notify_enabled
             self.cfg["notify"]["discord_webhook_url"] = webhook
 
-            save_json(CONFIG_FILE, self.cfg)
+            save_json(CONFIG_FILE, self.cfg, pretty=True)
             messagebox.showinfo("Saved", "Config saved.")
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
 
+    def _prune_history(self, now: int) -> bool:
+        window = int(self.cfg.get("time_window_seconds", 300))
+        changed = False
+        while self.history and now - self.history[0] > window:
+            self.history.popleft()
+            changed = True
+        return changed
+
+    def _persist_history(self) -> None:
+        save_json(self.state_file, list(self.history))
+
     def refresh_status(self, record: bool) -> None:
+        if record:
+            self._record_attempt()
+        # Coalesce bursts of refresh requests into a single redraw.
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
+
+    def _record_attempt(self) -> None:
         now = _now_ts()
-        history = load_json(self.state_file, default=[])
-        if not isinstance(history, list):
-            history = []
+        changed = self._prune_history(now)
 
         locked = self.lock_file.exists()
-
-        if record and not locked:
-            history.append(now)
-            save_json(self.state_file, history)
+        if not locked:
+            self.history.append(now)
+            changed = True
             append_log(self.log_file, "Recorded start attempt (UI).")
 
-        status = compute_status(self.cfg, history, now, locked)
-        save_json(self.state_file, status.timestamps)
+        if changed:
+            self._persist_history()
+
+        if locked:
+            return
 
         max_attempts = int(self.cfg.get("max_attempts", 3))
-        if record and (len(status.timestamps) >= max_attempts) and not self.lock_file.exists():
+        if len(self.history) >= max_attempts:
             self.lock_file.touch()
-            status = compute_status(self.cfg, status.timestamps, now, True)
+            status = compute_status(self.cfg, list(self.history), now, True)
             append_log(self.log_file, f"LOCKED (threshold reached). {len(status.timestamps)} in window.")
-            save_json(self.incident_file, make_incident(self.cfg, status, now))
+            save_json(self.incident_file, make_incident(self.cfg, status, now, self._hostname, self._fqdn))
             self._maybe_notify(status)
 
-        self._set_badge(status.state)
-        self.lbl_status.configure(text=status.message)
-        self.lbl_counts.configure(text=f"Attempts in window: {status.attempt_count} | Threshold: {status.max_attempts} | Window: {status.window_seconds}s")
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        now = _now_ts()
+        if self._prune_history(now):
+            self._persist_history()
+
+        locked = self.lock_file.exists()
+        status = compute_status(self.cfg, list(self.history), now, locked)
+
+        # Widget configure calls are not free; skip them when nothing
+        # user-visible changed since the last render.
+        render_key = (status.state, status.attempt_count, status.max_attempts, status.window_seconds)
+        if render_key != self._last_render:
+            self._last_render = render_key
+            self._set_badge(status.state)
+            self.lbl_status.configure(text=status.message)
+            self.lbl_counts.configure(text=f"Attempts in window: {status.attempt_count} | Threshold: {status.max_attempts} | Window: {status.window_seconds}s")
 
-        self.lb.delete(0, tk.END)
-        for ts in reversed(status.timestamps):
-            self.lb.insert(tk.END, f"{_iso(ts)}  ({ts})")
+        self._render_history(status.timestamps)
 
         self._refresh_log()
 
+    def _render_history(self, timestamps: List[int]) -> None:
+        """Diff against the previous render: newest rows go on top, expired
+        rows drop off the bottom, so Tk calls are O(changes) not O(rows)."""
+        shown = self._lb_shown
+        while shown and (not timestamps or shown[0] < timestamps[0]):
+            shown.pop(0)
+            self.lb.delete(tk.END)
+        if shown != timestamps[:len(shown)]:
+            self.lb.delete(0, tk.END)
+            shown.clear()
+        new = timestamps[len(shown):]
+        for ts in new:
+            shown.append(ts)
+            self.lb.insert(0, f"{_iso(ts)}  ({ts})")
+
+    def _flush_logs(self) -> None:
+        flush_log_buffer()
+        self.after(250, self._flush_logs)
+
+    def _on_close(self) -> None:
+        flush_log_buffer()
+        self.destroy()
+
     def _refresh_log(self) -> None:
-        tail = tail_file(self.log_file, 80)
-        self.txt_log.delete("1.0", tk.END)
-        self.txt_log.insert("1.0", tail)
+        flush_log_buffer()
+        try:
+            size = self.log_file.stat().st_size
+        except OSError:
+            size = 0
+        if self._log_shown_end is not None and size == self._log_shown_end:
+            return
+        if self._log_shown_end is None or size < self._log_shown_end:
+            # First render, or the file was truncated/rotated: show the tail.
+            self.txt_log.delete("1.0", tk.END)
+            tail = tail_file(self.log_file, 80)
+            if tail:
+                self.txt_log.insert("1.0", tail + "\n")
+            self._log_shown_end = size
+            return
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(self._log_shown_end)
+                new = f.read().decode("utf-8", errors="ignore")
+        except OSError:
+            return
+        self._log_shown_end = size
+        self.txt_log.insert(tk.END, new)
+        while int(self.txt_log.index("end-1c").split(".")[0]) > 80:
+            self.txt_log.delete("1.0", "2.0")
 
     def _set_badge(self, state: str) -> None:
-        if state == "OK":
-            bg, fg, txt = C_ACCENT, "#ffffff", "OK"
-        elif state == "WARNING":
-            bg, fg, txt = C_WARN, "#111111", "WARNING"
-        else:
-            bg, fg, txt = C_BAD, "#111111", "LOCKED"
+        bg, fg, txt = _BADGE.get(state, _BADGE["LOCKED"])
         self.status_badge.configure(text=txt, bg=bg, fg=fg)
 
     def unlock(self) -> None:
@@ -434,8 +676,9 @@ class App(tk.Tk):
         if not messagebox.askyesno("Clear history", "Clear attempt history?"):
             return
         try:
-            if self.state_file.exists():
-                self.state_file.unlink()
+            self.history.clear()
+            self.state_file.unlink(missing_ok=True)
+            _WRITE_HASHES.pop(self.state_file, None)
             append_log(self.log_file, "History cleared (UI).")
             messagebox.showinfo("Cleared", "Attempt history cleared.")
             self.refresh_status(record=False)
@@ -443,7 +686,7 @@ class App(tk.Tk):
             messagebox.showerror("Clear failed", str(e))
 
     def _maybe_notify(self, status: Status) -> None:
-        notify_cfg = self.cfg.get("notify", {}) if isinstance(self.cfg.get("notify", {}), dict) else {}
+        notify_cfg = self.cfg["notify"]
         if not notify_cfg.get("enabled"):
             return
         webhook = str(notify_cfg.get("discord_webhook_url", "")).strip()
@@ -451,32 +694,41 @@ class App(tk.Tk):
             append_log(self.log_file, "Notify enabled but webhook empty.")
             return
 
+        # Rapid lock/unlock cycles can re-trigger identical incidents;
+        # skip duplicates posted within the last 30 seconds.
+        now = time.time()
+        key = (status.state, status.attempt_count, webhook)
+        if key == self._last_notify and now - self._last_notify_ts < 30:
+            return
+
         last_lines = int(notify_cfg.get("include_last_lines", 40))
-        extra = notify_cfg.get("extra_context", {}) if isinstance(notify_cfg.get("extra_context", {}), dict) else {}
-
-        msg = (
-            f"❌ **Restart loop LOCKED**\n"
-            f"- **Reason:** {status.message}\n"
-            f"- **Attempts in window:** {status.attempt_count}\n"
-            f"- **Window:** {status.window_seconds}s\n"
-            f"- **Host:** {socket.gethostname()}\n"
-        )
+        extra = notify_cfg["extra_context"]
+
+        parts = [
+            "❌ **Restart loop LOCKED**\n",
+            f"- **Reason:** {status.message}\n",
+            f"- **Attempts in window:** {status.attempt_count}\n",
+            f"- **Window:** {status.window_seconds}s\n",
+            f"- **Host:** {self._hostname}\n",
+        ]
         if extra.get("server_name"):
-            msg += f"- **Server:** {extra.get('server_name')}\n"
+            parts.append(f"- **Server:** {extra.get('server_name')}\n")
         if extra.get("host"):
-            msg += f"- **Server Host:** {extra.get('host')}\n"
+            parts.append(f"- **Server Host:** {extra.get('host')}\n")
         if extra.get("notes"):
-            msg += f"- **Notes:** {extra.get('notes')}\n"
+            parts.append(f"- **Notes:** {extra.get('notes')}\n")
 
         snippet = tail_file(self.log_file, last_lines)
         if snippet:
-            msg += "\n**Last log lines:**\n```text\n" + snippet[-1500:] + "\n```"
+            parts.append("\n**Last log lines:**\n```text\n")
+            parts.append(snippet[-1500:])
+            parts.append("\n```")
+        msg = "".join(parts)
 
-        try:
-            post_discord(webhook, msg)
-            append_log(self.log_file, "Notification sent (Discord).")
-        except Exception as e:
-            append_log(self.log_file, f"Notification failed: {e!r}")
+        post_discord(webhook, msg, log_file=self.log_file)
+        append_log(self.log_file, "Notification queued (Discord).")
+        self._last_notify = key
+        self._last_notify_ts = now
 
     def test_discord(self) -> None:
         if not bool(self.var_notify_enabled.get()):
@@ -487,7 +739,7 @@ class App(tk.Tk):
             messagebox.showerror("Discord", "Webhook URL is empty.")
             return
         try:
-            post_discord(webhook, f"✅ Restart Loop Guard UI test from **{socket.gethostname()}** at {_iso()}.")
+            _post_discord_sync(webhook, f"✅ Restart Loop Guard UI test from **{self._hostname}** at {_iso()}.")
             messagebox.showinfo("Discord", "Test message sent.")
         except Exception as e:
             messagebox.showerror("Discord", str(e))
@@ -5,9 +5,11 @@ import os
 import sys
 import json
 import subprocess
+import functools
 import pathlib
-import traceback
-from dataclasses import dataclass
+import queue
+import threading
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
 try:
@@ -96,46 +98,107 @@ def ensure_dirs():
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Parsed tools.json keyed on (mtime_ns, size): reloads of an unchanged
+# file cost one stat() instead of a read + json.loads.
+_tools_cache: Dict[str, Any] = {"key": None, "value": None}
+
 def load_tools() -> Dict[str, Any]:
-    if not CONFIG_PATH.exists():
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
         save_tools(DEFAULT_TOOLS)
         return DEFAULT_TOOLS
+    key = (st.st_mtime_ns, st.st_size)
+    if _tools_cache["key"] == key:
+        return _tools_cache["value"]
     try:
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        obj = json.loads(CONFIG_PATH.read_bytes())
     except Exception:
         return DEFAULT_TOOLS
+    _tools_cache["key"] = key
+    _tools_cache["value"] = obj
+    return obj
 
 def save_tools(obj: Dict[str, Any]) -> None:
-    CONFIG_PATH.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    new = json.dumps(obj, indent=2, ensure_ascii=False, separators=(",", ": ")).encode("utf-8")
+    try:
+        if CONFIG_PATH.read_bytes() == new:
+            return
+    except OSError:
+        pass
+    tmp = CONFIG_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, CONFIG_PATH)
+    try:
+        st = CONFIG_PATH.stat()
+        _tools_cache["key"] = (st.st_mtime_ns, st.st_size)
+        _tools_cache["value"] = obj
+    except OSError:
+        _tools_cache["key"] = None
 
 def open_path(path: pathlib.Path) -> None:
     p = str(path)
     if sys.platform.startswith("win"):
         os.startfile(p)  # type: ignore
     elif sys.platform == "darwin":
-        os.system(f'open "{p}"')
+        subprocess.Popen(["open", p], close_fds=True)
     else:
-        os.system(f'xdg-open "{p}"')
+        subprocess.Popen(["xdg-open", p], close_fds=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
+@functools.lru_cache(maxsize=256)
 def abs_path(rel_or_abs: str) -> pathlib.Path:
+    # resolve() stats every path component; entries are stable between
+    # reloads, so memoize (cleared via abs_path.cache_clear on reload).
     p = pathlib.Path(rel_or_abs)
     if p.is_absolute():
         return p
     return (BASE_DIR / p).resolve()
 
-@dataclass
+@dataclass(frozen=True)
 class ToolItem:
     id: str
     name: str
     type: str        # python | exe | command
     entry: str
     cwd: str = ""
-    args: List[str] = None  # type: ignore
+    args: List[str] = field(default_factory=list)
     description: str = ""
 
-    def __post_init__(self):
-        if self.args is None:
-            self.args = []
+# Theme spec built once at import time; apply_dark_theme just walks it.
+_STYLE_CONFIG = (
+    (".", {"background": C_BG, "foreground": C_TEXT}),
+    ("TFrame", {"background": C_BG}),
+    ("TLabel", {"background": C_BG, "foreground": C_TEXT}),
+    ("TLabelFrame", {"background": C_BG, "foreground": C_TEXT}),
+    ("TLabelFrame.Label", {"background": C_BG, "foreground": C_TEXT}),
+    ("TButton", {"background": C_PANEL, "foreground": C_TEXT, "borderwidth": 1,
+                 "focusthickness": 2, "focuscolor": C_ACCENT}),
+    ("TEntry", {"fieldbackground": C_PANEL, "background": C_PANEL, "foreground": C_TEXT,
+                "insertcolor": C_TEXT}),
+    ("TCombobox", {"fieldbackground": C_PANEL, "background": C_PANEL, "foreground": C_TEXT,
+                   "arrowcolor": C_TEXT}),
+    ("Treeview", {"background": C_PANEL, "fieldbackground": C_PANEL, "foreground": C_TEXT,
+                  "bordercolor": "#1f1f1f", "rowheight": 24}),
+    ("Treeview.Heading", {"background": "#242424", "foreground": C_TEXT, "relief": "flat"}),
+    ("TSeparator", {"background": "#1f1f1f"}),
+    ("Colored.TButton", {"foreground": "white", "background": C_ACCENT, "padding": (10, 6),
+                         "font": ("Helvetica", 10, "bold")}),
+)
+
+_STYLE_MAP = (
+    ("TButton", {"background": [("active", "#3a3a3a"), ("pressed", "#3f3f3f")],
+                 "foreground": [("disabled", C_MUTED)]}),
+    ("TCombobox", {"fieldbackground": [("readonly", C_PANEL)],
+                   "background": [("readonly", C_PANEL)],
+                   "foreground": [("readonly", C_TEXT)]}),
+    ("Treeview", {"background": [("selected", "#1f3b2b")],
+                  "foreground": [("selected", "#ffffff")]}),
+    ("Treeview.Heading", {"background": [("active", "#2d2d2d")]}),
+    ("Colored.TButton", {"background": [("active", "#66BB6A"), ("pressed", "#388E3C"),
+                                        ("disabled", "#555555")],
+                         "foreground": [("disabled", "#aaaaaa")]}),
+)
 
 def apply_dark_theme(root: tk.Tk) -> ttk.Style:
     style = ttk.Style(root)
@@ -146,41 +209,10 @@ def apply_dark_theme(root: tk.Tk) -> ttk.Style:
 
     root.configure(bg=C_BG)
 
-    style.configure(".", background=C_BG, foreground=C_TEXT)
-    style.configure("TFrame", background=C_BG)
-    style.configure("TLabel", background=C_BG, foreground=C_TEXT)
-    style.configure("TLabelFrame", background=C_BG, foreground=C_TEXT)
-    style.configure("TLabelFrame.Label", background=C_BG, foreground=C_TEXT)
-
-    style.configure("TButton", background=C_PANEL, foreground=C_TEXT, borderwidth=1, focusthickness=2, focuscolor=C_ACCENT)
-    style.map("TButton",
-              background=[("active", "#3a3a3a"), ("pressed", "#3f3f3f")],
-              foreground=[("disabled", C_MUTED)])
-
-    style.configure("TEntry", fieldbackground=C_PANEL, background=C_PANEL, foreground=C_TEXT, insertcolor=C_TEXT)
-    style.configure("TCombobox", fieldbackground=C_PANEL, background=C_PANEL, foreground=C_TEXT, arrowcolor=C_TEXT)
-    style.map("TCombobox",
-              fieldbackground=[("readonly", C_PANEL)],
-              background=[("readonly", C_PANEL)],
-              foreground=[("readonly", C_TEXT)])
-
-    style.configure("Treeview",
-                    background=C_PANEL,
-                    fieldbackground=C_PANEL,
-                    foreground=C_TEXT,
-                    bordercolor="#1f1f1f",
-                    rowheight=24)
-    style.map("Treeview",
-              background=[("selected", "#1f3b2b")],
-              foreground=[("selected", "#ffffff")])
-    style.configure("Treeview.Heading",
-                    background="#242424",
-                    foreground=C_TEXT,
-                    relief="flat")
-    style.map("Treeview.Heading",
-              background=[("active", "#2d2d2d")])
-
-    style.configure("TSeparator", background="#1f1f1f")
+    for name, kw in _STYLE_CONFIG:
+        style.configure(name, **kw)
+    for name, kw in _STYLE_MAP:
+        style.map(name, **kw)
     return style
 
 def style_text_widget(txt: tk.Text) -> None:
@@ -197,6 +229,16 @@ def style_text_widget(txt: tk.Text) -> None:
         bd=0
     )
 
+# Widget factories with the recurring panel colors pre-bound, plus shared
+# font tuples so Tk's font lookup hits its internal cache on repeats.
+FONT_TITLE = ("Segoe UI", 14, "bold")
+FONT_LINK = ("Segoe UI", 10, "underline")
+FONT_SMALL = ("Segoe UI", 9)
+PanelFrame = functools.partial(tk.Frame, bg=C_PANEL)
+PanelLabel = functools.partial(tk.Label, bg=C_PANEL, fg=C_TEXT)
+MutedLabel = functools.partial(tk.Label, bg=C_PANEL, fg=C_MUTED)
+AccentLabel = functools.partial(tk.Label, bg=C_PANEL, fg=C_ACCENT)
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -207,51 +249,97 @@ class App(tk.Tk):
         ensure_dirs()
         self.style = apply_dark_theme(self)
 
+        # full tracebacks in the log only when explicitly requested
+        self._debug = bool(os.environ.get("AUTOMATIONZ_DEBUG"))
+
         self._img_logo: Optional[tk.PhotoImage] = None
         self._img_bg: Optional[tk.PhotoImage] = None
+        # decoded PhotoImages keyed on file mtime; re-runs skip the decode
+        self._asset_cache: Dict[pathlib.Path, tuple[int, tk.PhotoImage]] = {}
 
         # running processes by tool id
         self._procs: Dict[str, subprocess.Popen] = {}
+        # last status string rendered per tree row, to skip no-op tree.set calls
+        self._last_status: Dict[str, str] = {}
+        # entry-exists snapshot per tool id, rebuilt on (re)load
+        self._entry_exists: Dict[str, bool] = {}
+        # (raw dict, parsed list) from the last _parse_tools run
+        self._parsed_tools: Optional[tuple] = None
+        # selection updates coalesced through a single pending after_idle
+        self._select_pending = False
+        self._pending_tool: Optional[ToolItem] = None
+        self._applied_tool: Optional[ToolItem] = None
+
+        # disk-side logging goes through a queue to a writer thread that
+        # keeps the file open, instead of open/write/close per line
+        self._log_q: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        threading.Thread(target=self._log_worker, daemon=True).start()
+        # widget-side log lines buffered and flushed once per idle turn
+        self._log_buf: List[str] = []
+        self._log_flush_pending = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.tools_raw = load_tools()
         self.tools: List[ToolItem] = self._parse_tools(self.tools_raw)
 
+        # tool ids whose status row needs repainting, flushed on idle
+        self._dirty_tools: set[str] = set()
+        self._dirty_pending = False
+
         self._build_ui()
         self._refresh_list()
 
-        # periodic refresh of running state indicators
-        self.after(1000, self._tick_processes)
+        # slow safety tick: catches entries appearing/disappearing on disk
+        self.after(5000, self._safety_tick)
 
     def _parse_tools(self, obj: Dict[str, Any]) -> List[ToolItem]:
-        out: List[ToolItem] = []
-        for t in obj.get("tools", []):
-            out.append(ToolItem(
-                id=str(t.get("id", "")),
-                name=str(t.get("name", "")),
-                type=str(t.get("type", "python")),
-                entry=str(t.get("entry", "")),
-                cwd=str(t.get("cwd", "")),
-                args=list(t.get("args", []) or []),
-                description=str(t.get("description", "")),
-            ))
+        cached = self._parsed_tools
+        if cached is not None and cached[0] is obj:
+            # Same raw dict (load_tools cache hit): reuse the parsed list,
+            # but still re-stat entries so Refresh acts as a rescan.
+            out = cached[1]
+        else:
+            _str, _list, TI = str, list, ToolItem
+            out = []
+            for t in obj.get("tools") or ():
+                out.append(TI(
+                    id=_str(t.get("id", "")),
+                    name=_str(t.get("name", "")),
+                    type=_str(t.get("type", "python")),
+                    entry=_str(t.get("entry", "")),
+                    cwd=_str(t.get("cwd", "")),
+                    args=_list(t.get("args") or ()),
+                    description=_str(t.get("description", "")),
+                ))
+            self._parsed_tools = (obj, out)
+        # Stat entries once per reload; _tool_status reads this map so the
+        # per-row status checks never hit the disk.
+        self._entry_exists = {t.id: abs_path(t.entry).exists() for t in out if t.type in ("python", "exe")}
         return out
 
+    def _load_image(self, path: pathlib.Path) -> Optional[tk.PhotoImage]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        hit = self._asset_cache.get(path)
+        if hit is not None and hit[0] == st.st_mtime_ns:
+            return hit[1]
+        try:
+            img = tk.PhotoImage(file=str(path))
+        except Exception:
+            return None
+        self._asset_cache[path] = (st.st_mtime_ns, img)
+        return img
+
     def _try_load_assets(self) -> None:
-        bg_path = ASSETS_DIR / "bg.png"
-        if bg_path.exists():
-            try:
-                self._img_bg = tk.PhotoImage(file=str(bg_path))
-                self._bg_label.configure(image=self._img_bg)
-            except Exception:
-                self._img_bg = None
-
-        logo_path = ASSETS_DIR / "logo.png"
-        if logo_path.exists():
-            try:
-                self._img_logo = tk.PhotoImage(file=str(logo_path))
-                self._logo_label.configure(image=self._img_logo)
-            except Exception:
-                self._img_logo = None
+        self._img_bg = self._load_image(ASSETS_DIR / "bg.png")
+        if self._img_bg is not None:
+            self._bg_label.configure(image=self._img_bg)
+
+        self._img_logo = self._load_image(ASSETS_DIR / "logo.png")
+        if self._img_logo is not None:
+            self._logo_label.configure(image=self._img_logo)
 
     def _build_ui(self):
         self._bg_label = tk.Label(self, bg=C_BG, bd=0, highlightthickness=0)
@@ -272,37 +360,12 @@ class App(tk.Tk):
         title_box = tk.Frame(header_bg, bg=C_PANEL)
         title_box.pack(side="left", fill="x", expand=True)
 
-        tk.Label(title_box, text=APP_NAME, bg=C_PANEL, fg=C_TEXT, font=("TkDefaultFont", 14, "bold")).pack(anchor="w")
-        tk.Label(title_box, text=f"v{APP_VERSION}", bg=C_PANEL, fg=C_MUTED).pack(anchor="w")
+        PanelLabel(title_box, text=APP_NAME, font=("TkDefaultFont", 14, "bold")).pack(anchor="w")
+        MutedLabel(title_box, text=f"v{APP_VERSION}").pack(anchor="w")
 
         top = ttk.Frame(container)
         top.pack(fill="x", padx=12, pady=(0, 10))
 
-        style = ttk.Style(self)
-        try:
-            style.theme_use("clam")
-        except Exception:
-            pass
-
-        style.configure(
-            "Colored.TButton",
-            foreground="white",
-            background=C_ACCENT,
-            padding=(10, 6),
-            font=("Helvetica", 10, "bold")
-        )
-        style.map(
-            "Colored.TButton",
-            background=[
-                ("active", "#66BB6A"),
-                ("pressed", "#388E3C"),
-                ("disabled", "#555555"),
-            ],
-            foreground=[
-                ("disabled", "#aaaaaa"),
-            ]
-        )
-
         ttk.Label(top, text="Tools").pack(side="left")
         ttk.Button(top, text="Refresh", command=self._reload, style="Colored.TButton").pack(side="left", padx=8)
         ttk.Button(top, text="Manage Tools", command=self._manage_tools, style="Colored.TButton").pack(side="left")
@@ -364,12 +427,14 @@ class App(tk.Tk):
             fg=C_ACCENT,
             bg=C_BG,
             cursor="hand2",
-            font=("Segoe UI", 9)
+            font=FONT_SMALL
         )
         author.pack(side="right")
         author.bind("<Button-1>", self._open_author)
 
-        self._try_load_assets()
+        # Decode the PNGs after the first paint so the window shows up
+        # before the assets are loaded.
+        self.after_idle(self._try_load_assets)
 
     # ---------- Polished About / Contact ----------
 
@@ -389,18 +454,18 @@ class App(tk.Tk):
             messagebox.showerror("Copy failed", str(e))
 
     def _make_link_row(self, parent: tk.Widget, label: str, value: str, url: Optional[str] = None):
-        row = tk.Frame(parent, bg=C_PANEL)
+        row = PanelFrame(parent)
         row.pack(fill="x", pady=4)
 
-        tk.Label(row, text=label, bg=C_PANEL, fg=C_MUTED, width=10, anchor="w").pack(side="left")
-        link = tk.Label(row, text=value, bg=C_PANEL, fg=C_ACCENT, cursor="hand2", anchor="w", font=("Segoe UI", 10, "underline"))
+        MutedLabel(row, text=label, width=10, anchor="w").pack(side="left")
+        link = AccentLabel(row, text=value, cursor="hand2", anchor="w", font=FONT_LINK)
         link.pack(side="left", fill="x", expand=True)
         if url:
             link.bind("<Button-1>", lambda e: self._open_url(url))
         else:
             link.bind("<Button-1>", lambda e: self._copy_text(value))
 
-        btns = tk.Frame(row, bg=C_PANEL)
+        btns = PanelFrame(row)
         btns.pack(side="right")
         if url:
             ttk.Button(btns, text="Open", command=lambda: self._open_url(url)).pack(side="left", padx=4)
@@ -418,16 +483,16 @@ class App(tk.Tk):
         win.grab_set()
         win.configure(bg=C_BG)
 
-        wrap = tk.Frame(win, bg=C_PANEL, padx=16, pady=16)
+        wrap = PanelFrame(win, padx=16, pady=16)
         wrap.pack(fill="both", expand=True, padx=12, pady=12)
 
-        tk.Label(wrap, text=f"{APP_NAME}", bg=C_PANEL, fg=C_TEXT, font=("Segoe UI", 14, "bold")).pack(anchor="w")
-        tk.Label(wrap, text=f"Version {APP_VERSION}", bg=C_PANEL, fg=C_MUTED).pack(anchor="w", pady=(0, 10))
+        PanelLabel(wrap, text=f"{APP_NAME}", font=FONT_TITLE).pack(anchor="w")
+        MutedLabel(wrap, text=f"Version {APP_VERSION}").pack(anchor="w", pady=(0, 10))
 
-        tk.Label(
+        PanelLabel(
             wrap,
             text="A unified launcher for the AutomationZ toolchain.\nManage tools, launch scripts, and keep everything organized.",
-            bg=C_PANEL, fg=C_TEXT, justify="left"
+            justify="left"
         ).pack(anchor="w", pady=(0, 12))
 
         self._make_link_row(wrap, "GitHub", "github.com/DayZ-AutomationZ", "https://github.com/DayZ-AutomationZ")
@@ -451,11 +516,11 @@ class App(tk.Tk):
         win.grab_set()
         win.configure(bg=C_BG)
 
-        wrap = tk.Frame(win, bg=C_PANEL, padx=16, pady=16)
+        wrap = PanelFrame(win, padx=16, pady=16)
         wrap.pack(fill="both", expand=True, padx=12, pady=12)
 
-        tk.Label(wrap, text="Contact", bg=C_PANEL, fg=C_TEXT, font=("Segoe UI", 14, "bold")).pack(anchor="w")
-        tk.Label(wrap, text="Get in touch or support the project:", bg=C_PANEL, fg=C_TEXT).pack(anchor="w", pady=(0, 10))
+        PanelLabel(wrap, text="Contact", font=FONT_TITLE).pack(anchor="w")
+        PanelLabel(wrap, text="Get in touch or support the project:").pack(anchor="w", pady=(0, 10))
 
         email = "dannyautomationz@gmail.com"
         self._make_link_row(wrap, "Email", email, None)
@@ -490,7 +555,10 @@ class App(tk.Tk):
         win.transient(self)
         win.grab_set()
 
-        data = {"tools": [t for t in (self.tools_raw.get("tools", []) or [])]}
+        # Copy the tool dicts: "Apply change (stage)" edits them in place,
+        # and they must not alias the load_tools cache (or DEFAULT_TOOLS)
+        # until the user actually saves.
+        data = {"tools": [dict(t) for t in (self.tools_raw.get("tools", []) or [])]}
 
         root = ttk.Frame(win)
         root.pack(fill="both", expand=True, padx=12, pady=12)
@@ -553,9 +621,12 @@ class App(tk.Tk):
         def refresh_tree(select_index: Optional[int] = None):
             for item in tree.get_children():
                 tree.delete(item)
+            present = set()
             for i, t in enumerate(data["tools"]):
-                tree.insert("", "end", iid=str(i), values=(t.get("type","python"), t.get("entry","")))
-            if select_index is not None and str(select_index) in tree.get_children():
+                iid = str(i)
+                present.add(iid)
+                tree.insert("", "end", iid=iid, values=(t.get("type","python"), t.get("entry","")))
+            if select_index is not None and str(select_index) in present:
                 tree.selection_set(str(select_index))
                 tree.see(str(select_index))
                 on_select()
@@ -640,6 +711,7 @@ class App(tk.Tk):
                     messagebox.showerror("Invalid", "Type must be python/exe/command.", parent=win)
                     return
             save_tools(data)
+            abs_path.cache_clear()
             self.tools_raw = load_tools()
             self.tools = self._parse_tools(self.tools_raw)
             self._refresh_list()
@@ -665,20 +737,55 @@ class App(tk.Tk):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _log_worker(self) -> None:
+        try:
+            f = open(LOGS_DIR / "control_center.log", "a", encoding="utf-8", buffering=8192)
+        except OSError:
+            return
+        with f:
+            while True:
+                msg = self._log_q.get()
+                if msg is None:
+                    return
+                f.write(msg + "\n")
+                # drain whatever else is queued before the single flush
+                try:
+                    while True:
+                        msg = self._log_q.get_nowait()
+                        if msg is None:
+                            return
+                        f.write(msg + "\n")
+                except queue.Empty:
+                    pass
+                f.flush()
+
+    def _on_close(self):
+        self._log_q.put(None)
+        self.destroy()
+
     def _log(self, msg: str):
+        # One state-toggle + insert per idle turn instead of per message;
+        # launches log three lines back-to-back.
+        self._log_buf.append(msg)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after_idle(self._flush_log)
+
+        self._log_q.put(msg)
+
+    def _flush_log(self):
+        self._log_flush_pending = False
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf) + "\n"
+        self._log_buf.clear()
         self.log.configure(state="normal")
-        self.log.insert("end", msg + "\n")
+        self.log.insert("end", text)
         self.log.see("end")
         self.log.configure(state="disabled")
 
-        try:
-            lf = LOGS_DIR / "control_center.log"
-            with open(lf, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-        except Exception:
-            pass
-
     def _reload(self):
+        abs_path.cache_clear()
         self.tools_raw = load_tools()
         self.tools = self._parse_tools(self.tools_raw)
         self._refresh_list()
@@ -691,45 +798,98 @@ class App(tk.Tk):
         self._open_safe(CONFIG_PATH)
 
     def _tool_status(self, t: ToolItem) -> str:
-        p = self._procs.get(t.id)
-        if p is not None and p.poll() is None:
+        # Cheapest checks first: exited children are popped from _procs by
+        # their wait thread, so membership alone means "running", and
+        # command-type tools have a constant status when idle.
+        if t.id in self._procs:
             return "🟡 Running"
-
-        entry = abs_path(t.entry)
-        if t.type in ("python", "exe"):
-            return "🟢 Ready" if entry.exists() else "🔴 Missing"
-
         if t.type == "command":
             return "🟢 Ready"
+        if t.type in ("python", "exe"):
+            return "🟢 Ready" if self._entry_exists.get(t.id, False) else "🔴 Missing"
         return "?"
 
     def _refresh_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
+        # Diff against the current rows instead of delete-all + reinsert:
+        # rows are touched only when their name or status actually changed.
+        existing = set(self.tree.get_children())
+        wanted = set()
         for idx, t in enumerate(self.tools):
+            iid = str(idx)
+            wanted.add(iid)
             status = self._tool_status(t)
-            self.tree.insert("", "end", iid=str(idx), text=t.name, values=(status,))
-
-        if self.tools:
+            if iid in existing:
+                if self.tree.item(iid, "text") != t.name:
+                    self.tree.item(iid, text=t.name)
+                if self._last_status.get(iid) != status:
+                    self.tree.set(iid, "status", status)
+            else:
+                self.tree.insert("", "end", iid=iid, text=t.name, values=(status,))
+            self._last_status[iid] = status
+
+        for iid in existing - wanted:
+            self.tree.delete(iid)
+            self._last_status.pop(iid, None)
+
+        if self.tools and not self.tree.selection():
             self.tree.selection_set("0")
-            self._on_select()
-
-    def _tick_processes(self):
-        changed = False
-        for tid, proc in list(self._procs.items()):
-            if proc.poll() is not None:
-                del self._procs[tid]
-                changed = True
+        # Re-render the details pane so an edited name/description for the
+        # selected tool shows up; _apply_select no-ops when it is unchanged.
+        self._on_select()
+
+    def _wait_for_exit(self, tool_id: str, proc: subprocess.Popen) -> None:
+        """Runs on a daemon thread per launched child; streams the child's
+        output into the log pane and hands the exit notification back to
+        the Tk thread instead of 1 Hz polling."""
+        if proc.stdout is not None:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    self.after(0, self._log, f"[{tool_id}] {line}")
+            proc.stdout.close()
+        proc.wait()
+        self.after(0, self._on_child_exit, tool_id, proc)
+
+    def _on_child_exit(self, tool_id: str, proc: subprocess.Popen) -> None:
+        # Relaunching overwrites _procs[tool_id]; only evict the entry if it
+        # still belongs to the child that exited, so a stale notification
+        # can't mark a live relaunch as stopped.
+        if self._procs.get(tool_id) is proc:
+            self._procs.pop(tool_id, None)
+        self._mark_dirty(tool_id)
+        self.status_var.set("Ready.")
 
+    def _mark_dirty(self, tool_id: str) -> None:
+        self._dirty_tools.add(tool_id)
+        if not self._dirty_pending:
+            self._dirty_pending = True
+            self.after_idle(self._apply_dirty)
+
+    def _apply_dirty(self) -> None:
+        self._dirty_pending = False
+        dirty = self._dirty_tools
+        self._dirty_tools = set()
+        for tool_id in dirty:
+            self._refresh_tool_row(tool_id)
+
+    def _safety_tick(self) -> None:
+        for t in self.tools:
+            if t.type in ("python", "exe"):
+                exists = abs_path(t.entry).exists()
+                if exists != self._entry_exists.get(t.id):
+                    self._entry_exists[t.id] = exists
+                    self._mark_dirty(t.id)
+        self.after(5000, self._safety_tick)
+
+    def _refresh_tool_row(self, tool_id: str) -> None:
         for idx, t in enumerate(self.tools):
-            iid = str(idx)
-            if iid in self.tree.get_children():
-                self.tree.set(iid, "status", self._tool_status(t))
-
-        if changed:
-            self.status_var.set("Ready.")
-        self.after(1000, self._tick_processes)
+            if t.id == tool_id:
+                iid = str(idx)
+                status = self._tool_status(t)
+                if self.tree.exists(iid) and self._last_status.get(iid) != status:
+                    self._last_status[iid] = status
+                    self.tree.set(iid, "status", status)
+                return
 
     def _selected_tool(self) -> Optional[ToolItem]:
         sel = self.tree.selection()
@@ -742,9 +902,19 @@ class App(tk.Tk):
             return None
 
     def _on_select(self):
-        t = self._selected_tool()
-        if not t:
+        # Arrow-key navigation fires per row; coalesce the Text/label
+        # updates so at most one runs per event-loop turn.
+        self._pending_tool = self._selected_tool()
+        if not self._select_pending:
+            self._select_pending = True
+            self.after_idle(self._apply_select)
+
+    def _apply_select(self):
+        self._select_pending = False
+        t = self._pending_tool
+        if not t or t is self._applied_tool:
             return
+        self._applied_tool = t
 
         self.lbl_name.configure(text=t.name)
 
@@ -777,13 +947,24 @@ class App(tk.Tk):
             self._log("CMD: " + " ".join(cmd))
             if cwd:
                 self._log("CWD: " + str(cwd))
-            proc = subprocess.Popen(cmd, cwd=str(cwd) if cwd else None)
+            proc = subprocess.Popen(
+                cmd,
+                cwd=str(cwd) if cwd else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
             self._procs[t.id] = proc
+            threading.Thread(target=self._wait_for_exit, args=(t.id, proc), daemon=True).start()
             self.status_var.set(f"Launched: {t.name}")
-            self._tick_processes()
+            self._mark_dirty(t.id)
         except Exception as e:
-            self._log("ERROR: " + str(e))
-            self._log(traceback.format_exc())
+            self._log(f"ERROR: {type(e).__name__}: {e}")
+            if self._debug:
+                import traceback
+                self._log(traceback.format_exc())
             messagebox.showerror("Launch failed", str(e))
             self.status_var.set("Launch failed.")
 